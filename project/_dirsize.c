@@ -0,0 +1,126 @@
+/*
+ * _dirsize - Fast directory size walker for disk_analyzer.py
+ * Built by Claude on Raspberry Pi 5
+ *
+ * Walks a tree with openat/readdir/fstatat and returns the total size of
+ * all regular files, without creating a Python object per entry. Uses
+ * d_type to skip the stat() on directories when the filesystem fills it
+ * in (ext4, btrfs, xfs). Symlinks are never followed.
+ *
+ * The walk keeps one open directory per level of depth. If the process
+ * runs out of file descriptors (EMFILE/ENFILE) it raises OSError rather
+ * than silently skipping the subtree, so the caller can fall back.
+ *
+ * Build with: python3 setup.py build_ext --inplace
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <dirent.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+/* Out of file descriptors: the walk can't be completed, so abort it */
+#define FD_EXHAUSTED(e) ((e) == EMFILE || (e) == ENFILE)
+
+/*
+ * Sum regular file sizes under an open directory fd. Takes ownership of dfd.
+ * Sets *err to an errno and stops early if descriptors ran out.
+ */
+static unsigned long long dir_size_fd(int dfd, int *err)
+{
+    unsigned long long total = 0;
+    struct dirent *de;
+    struct stat st;
+    DIR *d = fdopendir(dfd);
+
+    if (d == NULL) {
+        if (FD_EXHAUSTED(errno))
+            *err = errno;
+        close(dfd);
+        return 0;
+    }
+
+    while (!*err && (de = readdir(d)) != NULL) {
+        const char *name = de->d_name;
+        unsigned char type = de->d_type;
+
+        if (name[0] == '.' && (name[1] == '\0' || (name[1] == '.' && name[2] == '\0')))
+            continue;
+
+        if (type == DT_REG || type == DT_UNKNOWN) {
+            if (fstatat(dirfd(d), name, &st, AT_SYMLINK_NOFOLLOW) != 0)
+                continue;
+            if (S_ISREG(st.st_mode)) {
+                total += (unsigned long long)st.st_size;
+                continue;
+            }
+            if (!S_ISDIR(st.st_mode))
+                continue;
+            type = DT_DIR;
+        }
+
+        if (type == DT_DIR) {
+            int fd = openat(dirfd(d), name, O_RDONLY | O_DIRECTORY | O_NOFOLLOW | O_CLOEXEC);
+            if (fd >= 0)
+                total += dir_size_fd(fd, err);
+            else if (FD_EXHAUSTED(errno))
+                *err = errno;
+        }
+    }
+
+    closedir(d);
+    return total;
+}
+
+static PyObject *dir_size(PyObject *self, PyObject *args)
+{
+    PyObject *path;
+    const char *cpath;
+    unsigned long long total = 0;
+    int fd, err = 0;
+
+    if (!PyArg_ParseTuple(args, "O&:dir_size", PyUnicode_FSConverter, &path))
+        return NULL;
+    cpath = PyBytes_AS_STRING(path);
+
+    /* Release the GIL so disk_analyzer's thread pool walks trees in parallel */
+    Py_BEGIN_ALLOW_THREADS
+    fd = open(cpath, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+    if (fd >= 0)
+        total = dir_size_fd(fd, &err);
+    else if (FD_EXHAUSTED(errno))
+        err = errno;
+    Py_END_ALLOW_THREADS
+
+    if (err) {
+        errno = err;
+        PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        Py_DECREF(path);
+        return NULL;
+    }
+    Py_DECREF(path);
+    return PyLong_FromUnsignedLongLong(total);
+}
+
+static PyMethodDef dirsize_methods[] = {
+    {"dir_size", dir_size, METH_VARARGS,
+     "dir_size(path) -> int\n\nTotal size in bytes of all regular files under path."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef dirsize_module = {
+    PyModuleDef_HEAD_INIT,
+    "_dirsize",
+    "Fast directory size walker for disk_analyzer.py",
+    -1,
+    dirsize_methods
+};
+
+PyMODINIT_FUNC PyInit__dirsize(void)
+{
+    return PyModule_Create(&dirsize_module);
+}
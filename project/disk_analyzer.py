@@ -6,47 +6,78 @@ Built by Claude on Raspberry Pi 5
 Shows what's taking up space on your Pi.
 """
 
+import heapq
 import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from rich.console import Console
-from rich.tree import Tree
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
+from rich.text import Text
 
 
 console = Console()
 
+# Optional C walker, build with: python3 setup.py build_ext --inplace
+try:
+    import _dirsize
+    DIRSIZE_EXT_AVAILABLE = True
+except ImportError:
+    DIRSIZE_EXT_AVAILABLE = False
+
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Row styles, built once rather than parsing markup per tree row
+STYLE_LARGE = Style(color="red")
+STYLE_MEDIUM = Style(color="yellow")
+STYLE_SMALL = Style(color="green")
+
 
 def format_size(size_bytes):
     """Format bytes to human readable"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    # bit_length gives floor(log2), so every 10 bits is one 1024x unit step
+    i = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_UNITS[i]}"
 
 
 def get_dir_size(path):
     """Get total size of a directory"""
+    if DIRSIZE_EXT_AVAILABLE:
+        try:
+            return _dirsize.dir_size(path)
+        except OSError:
+            pass  # Out of fds (deep tree, busy pool); this walk holds only one
+
     total = 0
-    try:
-        for entry in os.scandir(path):
-            try:
-                if entry.is_file(follow_symlinks=False):
-                    total += entry.stat().st_size
-                elif entry.is_dir(follow_symlinks=False):
-                    total += get_dir_size(entry.path)
-            except (PermissionError, OSError):
-                pass
-    except (PermissionError, OSError):
-        pass
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    total += st.st_size
+                elif stat.S_ISDIR(st.st_mode):
+                    stack.append(entry.path)
     return total
 
 
-def analyze_directory(path, depth=1, min_size_mb=10):
+def analyze_directory(path, depth=1, min_size_mb=10, max_items=50):
     """Analyze disk usage of a directory"""
+    # Deferred so --help doesn't pay for importing them
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.tree import Tree
+
     path = Path(path)
 
     if not path.exists():
@@ -63,6 +94,7 @@ def analyze_directory(path, depth=1, min_size_mb=10):
 
     # Collect directory sizes
     dirs_with_sizes = []
+    total_size = 0
 
     with Progress(
         SpinnerColumn(),
@@ -72,56 +104,61 @@ def analyze_directory(path, depth=1, min_size_mb=10):
         task = progress.add_task("Scanning directories...", total=None)
 
         try:
-            for entry in os.scandir(path):
-                try:
-                    if entry.is_dir(follow_symlinks=False):
-                        progress.update(task, description=f"Scanning {entry.name}...")
-                        size = get_dir_size(entry.path)
-                        dirs_with_sizes.append((entry.name, size, entry.path))
-                    elif entry.is_file(follow_symlinks=False):
-                        size = entry.stat().st_size
-                        if size >= min_size:
-                            dirs_with_sizes.append((entry.name, size, entry.path))
-                except (PermissionError, OSError):
-                    pass
+            entries = list(os.scandir(path))
         except PermissionError:
             console.print(f"[red]Permission denied: {path}[/red]")
             return
 
-    # Sort by size descending
-    dirs_with_sizes.sort(key=lambda x: x[1], reverse=True)
-
-    # Calculate total
-    total_size = sum(d[1] for d in dirs_with_sizes)
+        # Walk top-level directories concurrently so their I/O overlaps
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+            future_to_entry = {}
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                mode = st.st_mode
+                if stat.S_ISDIR(mode):
+                    future_to_entry[executor.submit(get_dir_size, entry.path)] = entry
+                elif stat.S_ISREG(mode) and st.st_size >= min_size:
+                    dirs_with_sizes.append((entry.name, st.st_size, entry.path, False))
+                    total_size += st.st_size
+
+            for future in as_completed(future_to_entry):
+                entry = future_to_entry[future]
+                progress.update(task, description=f"Scanned {entry.name}...")
+                size = future.result()
+                total_size += size
+                if size >= min_size:
+                    dirs_with_sizes.append((entry.name, size, entry.path, True))
+
+    # Largest first; only the top max_items get rendered, so partial sort
+    dirs_with_sizes = heapq.nlargest(max_items, dirs_with_sizes, key=lambda x: x[1])
 
     # Build tree
     tree = Tree(f"[bold cyan]{path}[/bold cyan] ({format_size(total_size)})")
 
-    for name, size, full_path in dirs_with_sizes:
-        if size < min_size:
-            continue
-
+    for name, size, full_path, is_dir in dirs_with_sizes:
         percent = (size / total_size * 100) if total_size > 0 else 0
 
         # Color based on size
         if size > 1024 * 1024 * 1024:  # > 1GB
-            color = "red"
+            style = STYLE_LARGE
         elif size > 100 * 1024 * 1024:  # > 100MB
-            color = "yellow"
+            style = STYLE_MEDIUM
         else:
-            color = "green"
+            style = STYLE_SMALL
 
-        is_dir = os.path.isdir(full_path)
         icon = "/" if is_dir else ""
 
-        tree.add(f"[{color}]{name}{icon}[/{color}] - {format_size(size)} ({percent:.1f}%)")
+        tree.add(Text.assemble((name + icon, style), f" - {format_size(size)} ({percent:.1f}%)"))
 
     console.print()
     console.print(tree)
     console.print()
 
     # Summary
-    console.print(f"[dim]Showing items >= {min_size_mb}MB[/dim]")
+    console.print(f"[dim]Showing up to {max_items} items >= {min_size_mb}MB[/dim]")
     console.print(f"[dim]Total analyzed: {format_size(total_size)}[/dim]")
 
 
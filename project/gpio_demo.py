@@ -11,6 +11,7 @@ Wiring:
   GPIO 27 --> Button --> GND (internal pull-up enabled)
 """
 
+import threading
 import time
 import sys
 from rich.console import Console
@@ -18,24 +19,35 @@ from rich.panel import Panel
 
 console = Console()
 
-# Check if running on actual Pi with GPIO
-try:
-    from gpiozero import LED, Button, Device
-    from gpiozero.pins.lgpio import LGPIOFactory
+# Whether gpiozero is usable; None until a hardware command first needs it
+GPIO_AVAILABLE = None
 
-    # Set the pin factory for Pi 5
-    try:
-        Device.pin_factory = LGPIOFactory()
-        GPIO_AVAILABLE = True
-    except Exception:
-        GPIO_AVAILABLE = True  # Try anyway
-except ImportError:
-    GPIO_AVAILABLE = False
+
+def load_gpio():
+    """Import gpiozero on first use so 'pinout' and help don't load it"""
+    global GPIO_AVAILABLE, LED, Button
+
+    if GPIO_AVAILABLE is None:
+        # Check if running on actual Pi with GPIO
+        try:
+            from gpiozero import LED, Button, Device
+            from gpiozero.pins.lgpio import LGPIOFactory
+
+            # Set the pin factory for Pi 5
+            try:
+                Device.pin_factory = LGPIOFactory()
+                GPIO_AVAILABLE = True
+            except Exception:
+                GPIO_AVAILABLE = True  # Try anyway
+        except ImportError:
+            GPIO_AVAILABLE = False
+
+    return GPIO_AVAILABLE
 
 
 def blink_led(pin=17, times=10, interval=0.5):
     """Blink an LED connected to the specified GPIO pin"""
-    if not GPIO_AVAILABLE:
+    if not load_gpio():
         console.print("[red]GPIO not available[/red]")
         return
 
@@ -68,7 +80,7 @@ def blink_led(pin=17, times=10, interval=0.5):
 
 def monitor_button(pin=27, timeout=30):
     """Monitor a button connected to the specified GPIO pin"""
-    if not GPIO_AVAILABLE:
+    if not load_gpio():
         console.print("[red]GPIO not available[/red]")
         return
 
@@ -94,9 +106,8 @@ def monitor_button(pin=27, timeout=30):
 
         console.print(f"\n[yellow]Waiting for button presses... (Press Ctrl+C to stop)[/yellow]")
 
-        start = time.time()
-        while time.time() - start < timeout:
-            time.sleep(0.1)
+        # Presses arrive via gpiozero callbacks; just block until timeout
+        threading.Event().wait(timeout)
 
         button.close()
         console.print(f"\n[green]Demo complete! Total presses: {press_count[0]}[/green]")
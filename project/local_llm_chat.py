@@ -6,30 +6,96 @@ Built by Claude on Raspberry Pi 5
 Chat with locally running AI models via Ollama.
 """
 
+import http.client
 import json
 import sys
-import urllib.request
-import urllib.error
+import time
+from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.prompt import Prompt
+
+# orjson parses straight from bytes and is much faster; fall back to stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
 
 console = Console()
 
-OLLAMA_URL = "http://localhost:11434"
+OLLAMA_HOST = "localhost"
+OLLAMA_PORT = 11434
+
+# Model list cache, so back-to-back runs skip the /api/tags round trip
+MODELS_CACHE = Path.home() / ".cache" / "let_claude_be" / "models.json"
+MODELS_CACHE_TTL = 60  # seconds
+
+# One keep-alive connection reused for every request in the session
+_conn = http.client.HTTPConnection(OLLAMA_HOST, OLLAMA_PORT)
+
+
+def ollama_request(method, path, body=None, timeout=120, headers=None):
+    """Send a request over the shared connection, reconnecting once if it was dropped"""
+    headers = {"Connection": "keep-alive", **(headers or {})}
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+
+    _conn.timeout = timeout
+    if _conn.sock is not None:
+        _conn.sock.settimeout(timeout)
+
+    for attempt in range(2):
+        try:
+            _conn.request(method, path, body=body, headers=headers)
+            return _conn.getresponse()
+        except (http.client.BadStatusLine, ConnectionError):
+            # Server closed the idle connection (RemoteDisconnected etc.)
+            _conn.close()
+            if attempt:
+                raise
 
 
 def get_models():
-    """Get list of available models"""
+    """Get list of available models, cached on disk for MODELS_CACHE_TTL seconds"""
     try:
-        with urllib.request.urlopen(f"{OLLAMA_URL}/api/tags", timeout=5) as response:
-            data = json.loads(response.read())
-            return [m['name'] for m in data.get('models', [])]
-    except Exception as e:
+        age = time.time() - MODELS_CACHE.stat().st_mtime
+        cached = json_loads(MODELS_CACHE.read_bytes())
+        if age < MODELS_CACHE_TTL:
+            return cached['names']
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = None
+
+    # Stale cache: revalidate with the stored ETag if the server gave one
+    headers = {}
+    if cached and cached.get('etag'):
+        headers["If-None-Match"] = cached['etag']
+
+    try:
+        response = ollama_request("GET", "/api/tags", timeout=5, headers=headers)
+        body = response.read()
+        if response.status == 304 and cached:
+            MODELS_CACHE.touch()
+            return cached['names']
+        data = json_loads(body)
+        names = [m['name'] for m in data.get('models', [])]
+        etag = response.getheader("ETag")
+    except Exception:
+        _conn.close()
         return []
 
+    if names:
+        try:
+            MODELS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            MODELS_CACHE.write_bytes(json_dumps({'names': names, 'etag': etag}))
+        except OSError:
+            pass
+    return names
+
 
 def chat(model, message, context=None):
     """Send a message to Ollama and stream the response"""
@@ -41,39 +107,57 @@ def chat(model, message, context=None):
     if context:
         data["context"] = context
 
-    req = urllib.request.Request(
-        f"{OLLAMA_URL}/api/generate",
-        data=json.dumps(data).encode(),
-        headers={"Content-Type": "application/json"}
-    )
-
-    full_response = ""
+    chunks_out = []
     new_context = None
 
     try:
-        with urllib.request.urlopen(req, timeout=120) as response:
-            console.print("[cyan]AI: [/cyan]", end="")
-            for line in response:
-                chunk = json.loads(line.decode())
+        response = ollama_request("POST", "/api/generate", body=json_dumps(data))
+        if response.status != 200:
+            error = json_loads(response.read() or b"{}").get("error", response.reason)
+            console.print(f"[red]Ollama error ({response.status}): {error}[/red]")
+            return None, None
+
+        console.print("[cyan]AI: [/cyan]", end="")
+        # Split NDJSON frames ourselves; bytearray.find is a C memchr scan.
+        # read1() still undoes the chunked transfer encoding for us.
+        buf = bytearray()
+        while True:
+            data = response.read1(4096)
+            if not data:
+                break
+            buf += data
+            while (nl := buf.find(b"\n")) != -1:
+                line = bytes(buf[:nl])
+                del buf[:nl + 1]
+                if not line:
+                    continue
+                chunk = json_loads(line)
                 text = chunk.get("response", "")
-                console.print(text, end="")
-                full_response += text
+                chunks_out.append(text)
+                # Bypass Rich markup/rendering for each streamed token
+                sys.stdout.write(text)
+                sys.stdout.flush()
                 if chunk.get("done"):
                     new_context = chunk.get("context")
-            console.print()  # newline
+        console.print()  # newline
 
-        return full_response, new_context
+        return ''.join(chunks_out), new_context
 
-    except urllib.error.URLError as e:
+    except OSError as e:
+        _conn.close()
         console.print(f"\n[red]Error connecting to Ollama: {e}[/red]")
         return None, None
     except Exception as e:
+        # Drop a half-read response so the next turn starts clean
+        _conn.close()
         console.print(f"\n[red]Error: {e}[/red]")
         return None, None
 
 
 def interactive_chat(model):
     """Interactive chat session"""
+    from rich.prompt import Prompt  # Only needed for interactive mode
+
     console.print(Panel(
         f"[bold cyan]Local LLM Chat[/bold cyan]\n"
         f"[dim]Model: {model}[/dim]\n"
@@ -3,36 +3,52 @@
 Network Scanner - Discover devices on your local network
 Built by Claude on Raspberry Pi 5
 
-Uses ARP scanning to find devices on the local network.
+Uses ICMP echo sweeps and the ARP table to find devices on the local network.
 """
 
+import array
+import asyncio
+import os
+import re
+import select
 import socket
+import struct
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import IPv4Network
 
+# Optional c-ares resolver so PTR lookups don't block a thread each
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_PAYLOAD = b'let_claude_be'
+
+# /proc/net/arp row: IP address, HW type, Flags, HW address, Mask, Device
+_ARP_RE = re.compile(r'^(\d+\.\d+\.\d+\.\d+)\s+\S+\s+\S+\s+([0-9a-fA-F:]{17})', re.M)
+
+# Report progress every 32 hosts (completed & mask == 0)
+PROGRESS_MASK = 31
+
 
 def get_local_network():
     """Get the local network CIDR"""
     try:
-        result = subprocess.run(
-            ['ip', 'route', 'get', '1'],
-            capture_output=True,
-            text=True
-        )
-        # Parse output like: "1.0.0.0 via 192.168.1.1 dev eth0 src 192.168.1.15"
-        parts = result.stdout.split()
-        local_ip = None
-        for i, part in enumerate(parts):
-            if part == 'src' and i + 1 < len(parts):
-                local_ip = parts[i + 1]
-                break
+        # Connecting a UDP socket sends nothing; the kernel just picks the
+        # outbound route and source address, same as 'ip route get'
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('1.1.1.1', 80))
+            local_ip = s.getsockname()[0]
 
-        if local_ip:
-            # Assume /24 network
-            network = '.'.join(local_ip.split('.')[:-1]) + '.0/24'
-            return network, local_ip
+        # Assume /24 network
+        network = '.'.join(local_ip.split('.')[:-1]) + '.0/24'
+        return network, local_ip
 
     except Exception as e:
         print(f"Error detecting network: {e}")
@@ -40,42 +56,163 @@ def get_local_network():
     return None, None
 
 
-def ping_host(ip):
-    """Ping a single host"""
+def icmp_checksum(data):
+    """Compute the 16-bit internet checksum (RFC 1071)"""
+    if len(data) & 1:
+        data += b'\x00'
+    # Sum native-order 16-bit words in C, then fold the carries once
+    total = sum(array.array('H', data))
+    total = (total & 0xFFFF) + (total >> 16)
+    total += total >> 16
+    checksum = ~total & 0xFFFF
+    # The ones' complement sum is byte-order neutral; swap back to network order
+    if sys.byteorder == 'little':
+        checksum = ((checksum >> 8) | (checksum << 8)) & 0xFFFF
+    return checksum
+
+
+def build_echo_request(ident, seq):
+    """Build an ICMP echo request packet"""
+    header = struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = icmp_checksum(header + ICMP_PAYLOAD)
+    return struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + ICMP_PAYLOAD
+
+
+def open_icmp_socket():
+    """Open an ICMP socket, preferring the unprivileged Linux ping socket.
+
+    Returns (sock, is_raw). Raw sockets need root/CAP_NET_RAW and deliver
+    replies with the IP header still attached.
+    """
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP), False
+    except OSError:
+        # EACCES outside ping_group_range, EPROTONOSUPPORT etc. on kernels
+        # without ping sockets
+        return socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP), True
+
+
+def ping_host(ip, timeout=1.0):
+    """Ping a single host with the system ping (setuid or cap_net_raw)"""
     try:
         result = subprocess.run(
-            ['ping', '-c', '1', '-W', '1', str(ip)],
+            ['ping', '-c', '1', '-W', str(max(1, round(timeout))), ip],
             capture_output=True,
-            timeout=2
+            timeout=timeout + 1
         )
         return result.returncode == 0
     except Exception:
         return False
 
 
+def ping_sweep_subprocess(hosts, timeout=1.0):
+    """Fallback sweep that forks ping per host, for when no ICMP socket is allowed"""
+    ips = {host_int: socket.inet_ntoa(struct.pack('!I', host_int)) for host_int in hosts}
+    with ThreadPoolExecutor(max_workers=50) as executor:
+        results = executor.map(lambda ip: ping_host(ip, timeout), ips.values())
+        return {host_int: ip for (host_int, ip), ok in zip(ips.items(), results) if ok}
+
+
+def ping_sweep(hosts, timeout=1.0):
+    """Ping every host (as an int) over a single ICMP socket.
+
+    Returns {host_int: ip_str} for the hosts that replied.
+    """
+    try:
+        sock, is_raw = open_icmp_socket()
+    except OSError as e:
+        # Neither socket type is allowed or supported here
+        print(f"Can't open an ICMP socket ({e}), falling back to the ping command (slower).")
+        print("To allow the fast sweep: sudo sysctl -w net.ipv4.ping_group_range='0 2147483647'")
+        return ping_sweep_subprocess(hosts, timeout)
+
+    ident = os.getpid() & 0xFFFF
+    pending = {}  # seq -> (host_int, ip_str)
+    alive = {}
+
+    with sock:
+        # Fire off every echo request up front, then collect replies
+        for seq, host_int in enumerate(hosts):
+            seq &= 0xFFFF
+            ip = socket.inet_ntoa(struct.pack('!I', host_int))
+            try:
+                sock.sendto(build_echo_request(ident, seq), (ip, 0))
+                pending[seq] = (host_int, ip)
+            except OSError:
+                pass
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([sock], [], [], remaining)
+            if not readable:
+                break
+            try:
+                packet, (addr, _) = sock.recvfrom(1024)
+            except OSError:
+                continue
+
+            if is_raw:
+                packet = packet[(packet[0] & 0x0F) * 4:]  # Strip IP header
+            if len(packet) < 8:
+                continue
+
+            icmp_type, _, _, reply_id, seq = struct.unpack('!BBHHH', packet[:8])
+            if icmp_type != ICMP_ECHO_REPLY:
+                continue
+            # Ping sockets rewrite the id themselves and only see their own replies
+            if is_raw and reply_id != ident:
+                continue
+
+            target = pending.get(seq)
+            if target is not None and target[1] == addr:
+                del pending[seq]
+                alive[target[0]] = addr
+
+    return alive
+
+
 def get_hostname(ip):
     """Try to resolve hostname"""
     try:
-        return socket.gethostbyaddr(str(ip))[0]
+        return socket.gethostbyaddr(ip)[0]
     except Exception:
         return None
 
 
-def get_mac_address(ip):
-    """Get MAC address from ARP table"""
+async def _resolve_hostnames_async(ips, timeout):
+    """Issue every PTR query at once over c-ares"""
+    resolver = aiodns.DNSResolver(timeout=timeout, tries=1)
+    results = await asyncio.gather(
+        *(resolver.gethostbyaddr(ip) for ip in ips),
+        return_exceptions=True
+    )
+    return [None if isinstance(r, Exception) else r.name for r in results]
+
+
+def resolve_hostnames(ips, timeout=1.0):
+    """Yield the hostname (or None) for each IP, in order"""
+    if AIODNS_AVAILABLE:
+        yield from asyncio.run(_resolve_hostnames_async(ips, timeout))
+        return
+
+    # gethostbyaddr blocks, so spread the lookups over a thread pool
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        yield from executor.map(get_hostname, ips)
+
+
+def load_arp_table():
+    """Read the kernel ARP table once, return {ip: mac}"""
     try:
-        result = subprocess.run(
-            ['arp', '-n', str(ip)],
-            capture_output=True,
-            text=True
-        )
-        parts = result.stdout.split()
-        for i, part in enumerate(parts):
-            if ':' in part and len(part) == 17:  # MAC address format
-                return part
-    except Exception:
-        pass
-    return None
+        with open('/proc/net/arp') as f:
+            text = f.read()
+    except OSError:
+        return {}
+
+    # Incomplete entries show an all-zero hardware address
+    return {ip: mac for ip, mac in _ARP_RE.findall(text) if mac != '00:00:00:00:00:00'}
 
 
 def scan_network(network, local_ip):
@@ -90,40 +227,45 @@ Scanning network: {network}
 Your IP: {local_ip}
 """)
 
-    hosts = list(IPv4Network(network, strict=False).hosts())
+    # Walk host addresses as plain ints, skipping network and broadcast
+    net = IPv4Network(network, strict=False)
+    base = int(net.network_address)
+    if net.num_addresses > 2:
+        hosts = range(base + 1, base + net.num_addresses - 1)
+    else:
+        hosts = range(base, base + net.num_addresses)
     active_hosts = []
 
     print(f"Scanning {len(hosts)} hosts...")
     print("-" * 60)
 
-    with ThreadPoolExecutor(max_workers=50) as executor:
-        future_to_ip = {executor.submit(ping_host, ip): ip for ip in hosts}
-
-        completed = 0
-        for future in as_completed(future_to_ip):
-            ip = future_to_ip[future]
-            completed += 1
-
-            # Progress indicator
-            if completed % 25 == 0:
-                print(f"  Progress: {completed}/{len(hosts)} hosts checked...")
-
-            if future.result():
-                hostname = get_hostname(ip)
-                mac = get_mac_address(ip)
-                active_hosts.append({
-                    'ip': str(ip),
-                    'hostname': hostname,
-                    'mac': mac,
-                    'is_self': str(ip) == local_ip
-                })
+    # Sorting by the int key leaves hosts in address order
+    responders = ping_sweep(hosts)
+    alive = [responders[host_int] for host_int in sorted(responders)]
+    arp_table = load_arp_table()
+
+    completed = 0
+    for ip, hostname in zip(alive, resolve_hostnames(alive)):
+        completed += 1
+
+        # Progress indicator, overwritten in place
+        if not (completed & PROGRESS_MASK):
+            sys.stdout.write(f"  Resolved {completed}/{len(alive)} hosts...\r")
+            sys.stdout.flush()
+
+        active_hosts.append({
+            'ip': ip,
+            'hostname': hostname,
+            'mac': arp_table.get(ip),
+            'is_self': ip == local_ip
+        })
 
     print("\n" + "=" * 60)
     print(f"\n  Found {len(active_hosts)} active hosts:\n")
     print(f"  {'IP Address':<16} {'Hostname':<25} {'MAC Address':<18}")
     print(f"  {'-'*16} {'-'*25} {'-'*18}")
 
-    for host in sorted(active_hosts, key=lambda x: [int(p) for p in x['ip'].split('.')]):
+    for host in active_hosts:
         marker = " <-- YOU" if host['is_self'] else ""
         hostname = host['hostname'] or '(unknown)'
         mac = host['mac'] or '(unknown)'
@@ -6,82 +6,190 @@ Built by Claude on a Raspberry Pi 5
 A real-time web dashboard for monitoring your Pi's health.
 """
 
+import gzip
+import heapq
 import json
+import os
+import socket
 import subprocess
 import time
-from collections import deque
-from datetime import datetime
-from threading import Lock
+from array import array
+from datetime import datetime, timedelta
+from threading import BoundedSemaphore, Condition, Lock, Thread
 
 import psutil
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response, request
+
+# orjson serializes the stats dict (and datetimes) in C; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Brotli compresses the dashboard page noticeably better than gzip; optional
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 
-# History storage (last 60 readings, ~1 per second)
+# Responses smaller than this aren't worth compressing
+COMPRESS_MIN_SIZE = 512
+COMPRESS_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# History storage (last 60 readings, ~1 per second), kept as one ring
+# buffer of doubles per field instead of a deque of dicts per metric.
+# Rows carry no timestamp: samples are evenly spaced and charts plot by index.
 MAX_HISTORY = 60
-history_lock = Lock()
-cpu_history = deque(maxlen=MAX_HISTORY)
-memory_history = deque(maxlen=MAX_HISTORY)
-temp_history = deque(maxlen=MAX_HISTORY)
-network_history = deque(maxlen=MAX_HISTORY)
+HISTORY_FIELDS = ('cpu', 'memory', 'temperature', 'rx', 'tx')
+history = {field: array('d', [0.0]) * MAX_HISTORY for field in HISTORY_FIELDS}
+history_count = 0  # Samples written so far; next slot is history_count % MAX_HISTORY
+
+# Readers never lock: the writer bumps history_seq to odd before touching
+# the ring and back to even after, and readers retry if it moved (a seqlock).
+# Only the sampler thread writes, so writers need no lock either.
+history_seq = 0
+
+# Stats are sampled once per second in the background; requests read the
+# latest published snapshot instead of sampling themselves
+SAMPLE_INTERVAL = 1.0
+latest_stats = None
+stats_version = 0  # Bumped on every publish; /api/stream waits on it
+_stats_published = Condition()
+_sampler_thread = None
+_sampler_start_lock = Lock()
+
+# How long an idle /api/stream waits before sending a keep-alive comment
+STREAM_KEEPALIVE = 15
+
+# Each open /api/stream holds a server thread for as long as the tab is
+# open. The servers run a fixed pool of SERVER_THREADS (gunicorn --threads
+# in start_dashboard.sh must match), so cap streams at half of it; extra
+# clients get a 503 and the page falls back to polling /api/stats.
+SERVER_THREADS = 8
+MAX_STREAMS = SERVER_THREADS // 2
+_stream_slots = BoundedSemaphore(MAX_STREAMS)
 
 # Track network bytes for rate calculation
 last_net_io = None
 last_net_time = None
 
+# Interface addresses rarely change; refresh them every NET_IF_TTL seconds
+NET_IF_TTL = 30
+_net_if_cache = (float('-inf'), {})  # Stale from the start, however soon after boot
+
+# sysfs nodes that expose the same data as vcgencmd, without a fork/exec
+THERMAL_PATH = '/sys/class/thermal/thermal_zone0/temp'
+THROTTLED_PATH = '/sys/devices/platform/soc/soc:firmware/get_throttled'
+# All Pi cores share one clock, so cpu0's frequency stands for the package
+CPU_FREQ_PATH = '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq'
+_sysfs_fds = {}
+
+# get_throttled bit layout: low bits are current state, bits 16+ are "has occurred"
+THROTTLE_KEYS = (
+    'under_voltage', 'arm_freq_capped', 'currently_throttled', 'soft_temp_limit',
+    'under_voltage_occurred', 'arm_freq_capped_occurred', 'throttled_occurred',
+    'soft_temp_limit_occurred',
+)
+THROTTLE_MASKS = (0x1, 0x2, 0x4, 0x8, 0x10000, 0x20000, 0x40000, 0x80000)
+
+# Prime the CPU counters so later interval=None calls measure since the last tick
+CPU_MIN_FIRST_INTERVAL = 0.1  # seconds; shorter windows read as 0% or 100%
+psutil.cpu_percent(percpu=True)
+_cpu_primed_at = time.monotonic()
+
+
+def read_sysfs(path):
+    """Read a small sysfs attribute, keeping its fd open between calls.
+
+    sysfs regenerates the value on each read from offset 0, so pread() on
+    a cached fd gives a fresh reading without reopening the file.
+    Returns None if the attribute isn't available.
+    """
+    fd = _sysfs_fds.get(path)
+    if fd is None:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        fd = _sysfs_fds.setdefault(path, fd)
+    try:
+        return os.pread(fd, 32, 0)
+    except OSError:
+        return None
+
 
 def get_cpu_temp():
-    """Get CPU temperature using vcgencmd"""
+    """Get CPU temperature from sysfs, falling back to vcgencmd"""
+    buf = read_sysfs(THERMAL_PATH)
+    if buf:
+        return int(buf) / 1000.0  # millidegrees C
+
     try:
         result = subprocess.run(
             ['vcgencmd', 'measure_temp'],
             capture_output=True,
-            text=True,
             timeout=2
         )
-        temp_str = result.stdout.strip()
-        # Parse "temp=54.9'C"
-        temp = float(temp_str.split('=')[1].split("'")[0])
-        return temp
+        # Slice the number out of b"temp=54.9'C\n" directly
+        return float(result.stdout[5:-3])
     except Exception:
         return None
 
 
+def get_cpu_freq():
+    """Get the CPU clock in MHz from cpu0's cpufreq node, falling back to psutil"""
+    buf = read_sysfs(CPU_FREQ_PATH)
+    if buf:
+        return int(buf) / 1000  # kHz
+    freq = psutil.cpu_freq()
+    return freq.current if freq else 0
+
+
 def get_throttle_status():
-    """Get throttling status from vcgencmd"""
+    """Get throttling status from the firmware sysfs node, falling back to vcgencmd"""
     try:
-        result = subprocess.run(
-            ['vcgencmd', 'get_throttled'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        # Returns "throttled=0x0" format
-        hex_val = result.stdout.strip().split('=')[1]
-        val = int(hex_val, 16)
-
-        status = {
-            'under_voltage': bool(val & 0x1),
-            'arm_freq_capped': bool(val & 0x2),
-            'currently_throttled': bool(val & 0x4),
-            'soft_temp_limit': bool(val & 0x8),
-            'under_voltage_occurred': bool(val & 0x10000),
-            'arm_freq_capped_occurred': bool(val & 0x20000),
-            'throttled_occurred': bool(val & 0x40000),
-            'soft_temp_limit_occurred': bool(val & 0x80000),
-        }
-        return status
+        buf = read_sysfs(THROTTLED_PATH)
+        if buf:
+            # Bare hex bitmask, e.g. "50005"
+            val = int(buf, 16)
+        else:
+            result = subprocess.run(
+                ['vcgencmd', 'get_throttled'],
+                capture_output=True,
+                timeout=2
+            )
+            # Slice the hex value out of b"throttled=0x0\n"
+            val = int(result.stdout[10:-1], 16)
+
+        return dict(zip(THROTTLE_KEYS, [bool(val & m) for m in THROTTLE_MASKS]))
     except Exception:
         return None
 
 
+def get_interface_addresses():
+    """Map each interface to its first IPv4 address, cached for NET_IF_TTL"""
+    global _net_if_cache
+    fetched_at, net_if = _net_if_cache
+    now = time.monotonic()
+    if now - fetched_at > NET_IF_TTL:
+        net_if = {}
+        for iface, addrs in psutil.net_if_addrs().items():
+            ipv4 = next((a.address for a in addrs if a.family == socket.AF_INET), None)
+            if ipv4 is not None:
+                net_if[iface] = ipv4
+        _net_if_cache = (now, net_if)
+    return net_if
+
+
 def get_network_speed():
     """Calculate network speed in bytes/sec"""
     global last_net_io, last_net_time
 
     current = psutil.net_io_counters()
-    current_time = time.time()
+    # Monotonic: the Pi has no RTC, so wall time can jump when NTP syncs
+    current_time = time.monotonic()
 
     if last_net_io is None:
         last_net_io = current
@@ -101,22 +209,99 @@ def get_network_speed():
     return {'rx_speed': rx_speed, 'tx_speed': tx_speed}
 
 
+def record_history(**sample):
+    """Write one sample (a value per HISTORY_FIELDS entry) into the ring"""
+    global history_count, history_seq
+    history_seq += 1
+    i = history_count % MAX_HISTORY
+    for field in HISTORY_FIELDS:
+        history[field][i] = sample[field]
+    history_count += 1
+    history_seq += 1
+
+
+def history_snapshot():
+    """Return the ring contents oldest-first as {field: [values]}"""
+    while True:
+        seq = history_seq
+        if seq & 1:
+            time.sleep(0)  # Write in progress, let the writer finish
+            continue
+        count = history_count
+        columns = {field: col[:] for field, col in history.items()}
+        if history_seq == seq:
+            break
+
+    n = min(count, MAX_HISTORY)
+    start = (count - n) % MAX_HISTORY
+    snapshot = {
+        field: (col[start:] + col[:start])[:n].tolist()
+        for field, col in columns.items()
+    }
+    # Missing temperature readings are stored as NaN; report them as null
+    snapshot['temperature'] = [t if t == t else None for t in snapshot['temperature']]
+    return snapshot
+
+
+def _json_default(obj):
+    """Stdlib json hook matching orjson's datetime output"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json(obj):
+    """Serialize to JSON bytes with orjson when it's installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default).encode()
+
+
+def fast_jsonify(obj):
+    """jsonify() replacement built on to_json()"""
+    return Response(to_json(obj), mimetype='application/json')
+
+
+def stats_delta(old, new):
+    """Fields of new that differ from old, diffed two levels deep"""
+    delta = {}
+    for key, value in new.items():
+        prev = old.get(key)
+        if value == prev:
+            continue
+        if isinstance(value, dict) and isinstance(prev, dict):
+            value = {k: v for k, v in value.items() if prev.get(k) != v}
+        delta[key] = value
+    return delta
+
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(bytes_val):
     """Format bytes to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f} PB"
+    i = min(max(0, (int(bytes_val).bit_length() - 1) // 10), len(_UNITS) - 1)
+    return f"{bytes_val / (1 << (10 * i)):.1f} {_UNITS[i]}"
+
+
+# RAM and disk size don't change while we run; format them once
+MEM_TOTAL_HUMAN = format_bytes(psutil.virtual_memory().total)
+DISK_TOTAL_HUMAN = format_bytes(psutil.disk_usage('/').total)
+
+
+def _process_cpu_key(proc):
+    """Sort key for top processes; cpu_percent is None when access is denied"""
+    cpu = proc.info['cpu_percent']
+    return cpu if cpu is not None else 0.0
 
 
 def get_system_stats():
     """Gather all system statistics"""
-    # CPU
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    cpu_freq = psutil.cpu_freq()
+    # CPU - one non-blocking per-core sample; the aggregate is their mean
+    per_cpu = psutil.cpu_percent(interval=None, percpu=True)
+    cpu_percent = sum(per_cpu) / len(per_cpu)
+    cpu_freq = get_cpu_freq()
     cpu_count = psutil.cpu_count()
-    per_cpu = psutil.cpu_percent(interval=0.1, percpu=True)
 
     # Memory
     mem = psutil.virtual_memory()
@@ -130,11 +315,7 @@ def get_system_stats():
     net_speed = get_network_speed()
 
     # Network interfaces
-    net_if = {}
-    for iface, addrs in psutil.net_if_addrs().items():
-        for addr in addrs:
-            if addr.family.name == 'AF_INET':
-                net_if[iface] = addr.address
+    net_if = get_interface_addresses()
 
     # Temperature
     temp = get_cpu_temp()
@@ -142,34 +323,36 @@ def get_system_stats():
     # Throttle status
     throttle = get_throttle_status()
 
-    # Uptime
-    boot_time = datetime.fromtimestamp(psutil.boot_time())
-    uptime = datetime.now() - boot_time
-    uptime_str = str(uptime).split('.')[0]  # Remove microseconds
+    # Uptime, straight from the kernel's boot clock: no /proc/stat read, and
+    # unlike now() - boot_time() it doesn't jump when NTP sets the clock
+    uptime_str = str(timedelta(seconds=int(time.clock_gettime(time.CLOCK_BOOTTIME))))
 
     # Load average
     load_avg = psutil.getloadavg()
 
-    # Top processes
+    # Top processes (partial sort, only 10 are shown). Rank every process by
+    # cpu_percent alone, then fetch name/memory for just the winners.
     processes = []
-    for proc in sorted(psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']),
-                       key=lambda x: x.info['cpu_percent'] or 0, reverse=True)[:10]:
+    for proc in heapq.nlargest(10, psutil.process_iter(['cpu_percent']), key=_process_cpu_key):
         try:
-            processes.append({
-                'pid': proc.info['pid'],
-                'name': proc.info['name'][:30],
-                'cpu': proc.info['cpu_percent'] or 0,
-                'mem': proc.info['memory_percent'] or 0
-            })
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+            info = proc.as_dict(attrs=['name', 'memory_percent'])
+        except psutil.NoSuchProcess:
+            continue  # Exited since the ranking pass
+        processes.append({
+            'pid': proc.pid,
+            'name': (info['name'] or '?')[:30],
+            'cpu': proc.info['cpu_percent'] or 0,
+            'mem': info['memory_percent'] or 0
+        })
 
     stats = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': datetime.now(),
         'cpu': {
             'percent': cpu_percent,
-            'per_cpu': per_cpu,
-            'frequency': cpu_freq.current if cpu_freq else 0,
+            # Whole percent is all the page shows; ints keep the JSON (and
+            # the stream deltas, since they change less often) small
+            'per_cpu': [round(p) for p in per_cpu],
+            'frequency': cpu_freq,
             'count': cpu_count,
         },
         'memory': {
@@ -177,7 +360,7 @@ def get_system_stats():
             'used': mem.used,
             'available': mem.available,
             'percent': mem.percent,
-            'total_human': format_bytes(mem.total),
+            'total_human': MEM_TOTAL_HUMAN,
             'used_human': format_bytes(mem.used),
         },
         'swap': {
@@ -190,7 +373,7 @@ def get_system_stats():
             'used': disk.used,
             'free': disk.free,
             'percent': disk.percent,
-            'total_human': format_bytes(disk.total),
+            'total_human': DISK_TOTAL_HUMAN,
             'used_human': format_bytes(disk.used),
             'free_human': format_bytes(disk.free),
         },
@@ -213,20 +396,51 @@ def get_system_stats():
     }
 
     # Update history
-    with history_lock:
-        cpu_history.append({'time': stats['timestamp'], 'value': cpu_percent})
-        memory_history.append({'time': stats['timestamp'], 'value': mem.percent})
-        if temp:
-            temp_history.append({'time': stats['timestamp'], 'value': temp})
-        network_history.append({
-            'time': stats['timestamp'],
-            'rx': net_speed['rx_speed'],
-            'tx': net_speed['tx_speed']
-        })
+    record_history(
+        cpu=cpu_percent,
+        memory=mem.percent,
+        temperature=temp if temp is not None else float('nan'),
+        rx=net_speed['rx_speed'],
+        tx=net_speed['tx_speed'],
+    )
 
     return stats
 
 
+def publish_stats(stats):
+    """Make stats the current snapshot and wake any /api/stream clients"""
+    global latest_stats, stats_version
+    with _stats_published:
+        latest_stats = stats
+        stats_version += 1
+        _stats_published.notify_all()
+
+
+def _sampler_loop():
+    """Refresh latest_stats every SAMPLE_INTERVAL seconds"""
+    started = time.monotonic()  # start_sampler() just took a sample
+    while True:
+        time.sleep(max(0.0, SAMPLE_INTERVAL - (time.monotonic() - started)))
+        started = time.monotonic()
+        try:
+            publish_stats(get_system_stats())
+        except Exception as e:
+            print(f"Error sampling stats: {e}")
+
+
+def start_sampler():
+    """Start the background sampler once; safe to call from any thread"""
+    global _sampler_thread
+    with _sampler_start_lock:
+        if _sampler_thread is None:
+            # Let the primed CPU window grow wide enough to mean something,
+            # then take the first sample here so callers always find a snapshot
+            time.sleep(max(0.0, CPU_MIN_FIRST_INTERVAL - (time.monotonic() - _cpu_primed_at)))
+            publish_stats(get_system_stats())
+            _sampler_thread = Thread(target=_sampler_loop, name='stats-sampler', daemon=True)
+            _sampler_thread.start()
+
+
 # HTML Template - Terminal/Hacker aesthetic
 DASHBOARD_HTML = '''
 <!DOCTYPE html>
@@ -716,16 +930,27 @@ DASHBOARD_HTML = '''
     </div>
 
     <script>
-        // Chart data storage
+        // Chart data storage - fixed-size ring buffers, nothing shifts per tick
+        const maxDataPoints = 60;
+
+        function makeSeries() {
+            return { buf: new Float32Array(maxDataPoints), idx: 0, len: 0 };
+        }
+
+        function pushSample(series, val) {
+            series.buf[series.idx] = val;
+            series.idx = (series.idx + 1) % maxDataPoints;
+            series.len = Math.min(maxDataPoints, series.len + 1);
+        }
+
         const chartData = {
-            cpu: [],
-            mem: [],
-            temp: []
+            cpu: makeSeries(),
+            mem: makeSeries(),
+            temp: makeSeries()
         };
-        const maxDataPoints = 60;
 
         // Simple chart drawing
-        function drawChart(canvasId, data, color, maxVal = 100) {
+        function drawChart(canvasId, series, color, maxVal = 100) {
             const canvas = document.getElementById(canvasId);
             if (!canvas) return;
             const ctx = canvas.getContext('2d');
@@ -735,26 +960,29 @@ DASHBOARD_HTML = '''
             ctx.fillStyle = '#111111';
             ctx.fillRect(0, 0, width, height);
 
-            if (data.length < 2) return;
+            if (series.len < 2) return;
 
             ctx.strokeStyle = color;
             ctx.lineWidth = 2;
             ctx.beginPath();
 
             const xStep = width / (maxDataPoints - 1);
-            const startX = width - (data.length - 1) * xStep;
+            const startX = width - (series.len - 1) * xStep;
+            // Oldest sample sits len slots behind the write index
+            const first = (series.idx - series.len + maxDataPoints) % maxDataPoints;
 
-            data.forEach((val, i) => {
+            for (let i = 0; i < series.len; i++) {
+                const val = series.buf[(first + i) % maxDataPoints];
                 const x = startX + i * xStep;
                 const y = height - (val / maxVal) * height;
                 if (i === 0) ctx.moveTo(x, y);
                 else ctx.lineTo(x, y);
-            });
+            }
 
             ctx.stroke();
 
             // Fill under the line
-            ctx.lineTo(startX + (data.length - 1) * xStep, height);
+            ctx.lineTo(startX + (series.len - 1) * xStep, height);
             ctx.lineTo(startX, height);
             ctx.closePath();
             ctx.fillStyle = color + '20';
@@ -783,7 +1011,7 @@ DASHBOARD_HTML = '''
             // CPU Cores
             const coresDiv = document.getElementById('cpu-cores');
             coresDiv.innerHTML = stats.cpu.per_cpu.map((p, i) =>
-                `<div class="cpu-core">C${i}: ${p.toFixed(0)}%</div>`
+                `<div class="cpu-core">C${i}: ${p}%</div>`
             ).join('');
 
             // Memory
@@ -864,13 +1092,9 @@ DASHBOARD_HTML = '''
             ).join('');
 
             // Update charts
-            chartData.cpu.push(stats.cpu.percent);
-            chartData.mem.push(stats.memory.percent);
-            if (stats.temperature) chartData.temp.push(stats.temperature);
-
-            if (chartData.cpu.length > maxDataPoints) chartData.cpu.shift();
-            if (chartData.mem.length > maxDataPoints) chartData.mem.shift();
-            if (chartData.temp.length > maxDataPoints) chartData.temp.shift();
+            pushSample(chartData.cpu, stats.cpu.percent);
+            pushSample(chartData.mem, stats.memory.percent);
+            if (stats.temperature) pushSample(chartData.temp, stats.temperature);
 
             drawChart('cpu-chart', chartData.cpu, '#00ff88');
             drawChart('mem-chart', chartData.mem, '#00ccff');
@@ -883,7 +1107,7 @@ DASHBOARD_HTML = '''
             el.className = 'throttle-item ' + (active ? 'active' : 'ok');
         }
 
-        // Fetch and update
+        // Fetch and update (fallback for browsers without EventSource)
         async function refresh() {
             try {
                 const response = await fetch('/api/stats');
@@ -894,37 +1118,161 @@ DASHBOARD_HTML = '''
             }
         }
 
-        // Initial load and start refresh loop
-        refresh();
-        setInterval(refresh, 1000);
+        // Live stream: the server sends a full snapshot, then only changed fields
+        const state = {};
+        let pending = false;
+
+        function mergeDelta(delta) {
+            for (const [key, value] of Object.entries(delta)) {
+                const prev = state[key];
+                if (value && prev && typeof value === 'object' &&
+                        typeof prev === 'object' && !Array.isArray(value)) {
+                    Object.assign(prev, value);
+                } else {
+                    state[key] = value;
+                }
+            }
+        }
+
+        function applyUpdate() {
+            pending = false;
+            updateDashboard(state);
+        }
+
+        let polling = null;
+
+        function startPolling() {
+            if (polling === null) {
+                refresh();
+                polling = setInterval(refresh, 1000);
+            }
+        }
+
+        if (window.EventSource) {
+            // EventSource reconnects by itself and the server resends a full snapshot
+            const stream = new EventSource('/api/stream');
+            // A refused stream (503 when the server is at its stream cap)
+            // closes for good instead of reconnecting
+            stream.onerror = () => {
+                if (stream.readyState === EventSource.CLOSED) {
+                    startPolling();
+                }
+            };
+            stream.onmessage = (e) => {
+                mergeDelta(JSON.parse(e.data));
+                // Coalesce DOM work into the next paint
+                if (!pending) {
+                    pending = true;
+                    requestAnimationFrame(applyUpdate);
+                }
+            };
+        } else {
+            startPolling();
+        }
     </script>
 </body>
 </html>
 '''
 
+# The template has no Jinja tags, so encode it once instead of rendering per request
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode('utf-8')
+
+# The page never changes, so compress it once per encoding, at the
+# strongest levels since the cost is paid only at import
+DASHBOARD_HTML_ENCODED = {None: DASHBOARD_HTML_BYTES,
+                          'gzip': gzip.compress(DASHBOARD_HTML_BYTES, compresslevel=9)}
+if brotli is not None:
+    DASHBOARD_HTML_ENCODED['br'] = brotli.compress(DASHBOARD_HTML_BYTES, quality=11)
+
+
+@app.after_request
+def compress_response(response):
+    """Compress JSON payloads for clients that accept it"""
+    # The page is served precompressed by dashboard()
+    if (response.status_code != 200 or response.is_streamed
+            or response.direct_passthrough or 'Content-Encoding' in response.headers
+            or response.mimetype != 'application/json'):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(COMPRESS_ENCODINGS)
+    data = response.get_data()
+    if encoding is None or len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    # Lowest levels: the payloads are small and repetitive, so speed wins
+    if encoding == 'br':
+        data = brotli.compress(data, quality=1)
+    else:
+        data = gzip.compress(data, compresslevel=1)
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
 
 @app.route('/')
 def dashboard():
     """Serve the dashboard HTML"""
-    return render_template_string(DASHBOARD_HTML)
+    encoding = request.accept_encodings.best_match(COMPRESS_ENCODINGS)
+    response = Response(DASHBOARD_HTML_ENCODED[encoding], mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    return response
 
 
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for system stats"""
-    return jsonify(get_system_stats())
+    if latest_stats is None:
+        start_sampler()
+    return fast_jsonify(latest_stats)
+
+
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events: a full snapshot, then only changed fields each tick"""
+    if latest_stats is None:
+        start_sampler()
+    if not _stream_slots.acquire(blocking=False):
+        return Response('Too many live streams, poll /api/stats instead\n',
+                        status=503, mimetype='text/plain',
+                        headers={'Retry-After': '30'})
+
+    def events():
+        sent = {}
+        version = None
+        while True:
+            # Never yield while holding the lock: a stalled client would
+            # keep the generator suspended inside it and block publish_stats()
+            with _stats_published:
+                updated = _stats_published.wait_for(lambda: stats_version != version,
+                                                    timeout=STREAM_KEEPALIVE)
+                if updated:
+                    version, stats = stats_version, latest_stats
+            if not updated:
+                yield b': keep-alive\n\n'
+                continue
+            delta = stats_delta(sent, stats)
+            sent = stats
+            yield b'data: ' + to_json(delta) + b'\n\n'
+
+    try:
+        response = Response(events(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        # The server closes the response when the client goes away (the next
+        # write fails), even if the generator never started; free the slot then
+        response.call_on_close(_stream_slots.release)
+    except BaseException:
+        _stream_slots.release()
+        raise
+    return response
 
 
 @app.route('/api/history')
 def api_history():
     """API endpoint for historical data"""
-    with history_lock:
-        return jsonify({
-            'cpu': list(cpu_history),
-            'memory': list(memory_history),
-            'temperature': list(temp_history),
-            'network': list(network_history),
-        })
+    return fast_jsonify(history_snapshot())
 
 
 if __name__ == '__main__':
@@ -942,5 +1290,15 @@ if __name__ == '__main__':
     ╚═══════════════════════════════════════════════════════════════╝
     """)
 
-    # Run on all interfaces so it's accessible on the network
-    app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+    start_sampler()
+
+    # Run on all interfaces so it's accessible on the network. Prefer
+    # waitress (a fixed thread pool) over Flask's thread-per-request server.
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+    else:
+        # MAX_STREAMS is derived from SERVER_THREADS, so open streams can
+        # never take every thread away from page and API requests
+        serve(app, host='0.0.0.0', port=5000, threads=SERVER_THREADS)
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Build the optional C directory walker used by disk_analyzer.py
+
+    python3 setup.py build_ext --inplace
+
+disk_analyzer.py falls back to a pure Python walk if it isn't built.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    name='dirsize',
+    ext_modules=[Extension('_dirsize', sources=['_dirsize.c'])],
+)
@@ -8,4 +8,11 @@ echo "Starting Raspberry Pi Dashboard..."
 echo "Open http://$(hostname -I | awk '{print $1}'):5000 in your browser"
 echo ""
 
+# Prefer gunicorn when installed (one worker, the stats sampler is shared).
+# --threads must match SERVER_THREADS in pi_dashboard.py, which sizes the
+# /api/stream cap.
+if command -v gunicorn > /dev/null; then
+    exec gunicorn -w 1 --threads 8 -b 0.0.0.0:5000 wsgi:app
+fi
+
 python3 pi_dashboard.py
@@ -6,30 +6,59 @@ Built by Claude on Raspberry Pi 5
 Uses the Rich library for beautiful terminal output.
 """
 
+import functools
+import os
 import platform
+import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import psutil
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.layout import Layout
 from rich import box
 
 
+console = Console()
+
+# Fixed for the life of the process, so read once at import
+UNAME = os.uname()
+PYTHON_VERSION = platform.python_version()
+BOOT_TIME = datetime.fromtimestamp(psutil.boot_time())
+
+
+@functools.cache
 def get_pi_model():
     """Get Raspberry Pi model info"""
     try:
-        with open('/proc/device-tree/model', 'r') as f:
-            return f.read().strip().rstrip('\x00')
+        # A ~30 byte NUL-terminated string; one raw read, no file object
+        fd = os.open('/proc/device-tree/model', os.O_RDONLY)
+        try:
+            data = os.read(fd, 256)
+        finally:
+            os.close(fd)
+        return data.rstrip(b'\x00').decode().strip()
     except Exception:
         return "Unknown Model"
 
 
+THERMAL_PATH = '/sys/class/thermal/thermal_zone0/temp'
+CPU_FREQ_PATH = '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq'
+
+
 def get_cpu_temp():
     """Get CPU temperature"""
+    try:
+        with open(THERMAL_PATH) as f:
+            return f"{int(f.read()) / 1000:.1f}'C"
+    except FileNotFoundError:
+        pass  # No thermal zone; ask the firmware instead
+    except Exception:
+        return "N/A"
+
     try:
         result = subprocess.run(
             ['vcgencmd', 'measure_temp'],
@@ -41,19 +70,28 @@ def get_cpu_temp():
         return "N/A"
 
 
+def get_cpu_freq():
+    """Get CPU frequency in MHz"""
+    try:
+        with open(CPU_FREQ_PATH, 'rb') as f:
+            return int(f.read()) / 1000  # kHz
+    except (OSError, ValueError):
+        freq = psutil.cpu_freq()
+        return freq.current if freq else None
+
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(bytes_val):
     """Format bytes to human readable"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f} PB"
+    i = min(max(0, (int(bytes_val).bit_length() - 1) // 10), len(_UNITS) - 1)
+    return f"{bytes_val / (1 << (10 * i)):.1f} {_UNITS[i]}"
 
 
 def get_uptime():
     """Get system uptime"""
-    boot = datetime.fromtimestamp(psutil.boot_time())
-    uptime = datetime.now() - boot
+    uptime = datetime.now() - BOOT_TIME
     days = uptime.days
     hours, remainder = divmod(uptime.seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
@@ -61,7 +99,27 @@ def get_uptime():
 
 
 def main():
-    console = Console()
+    # vcgencmd and the device-tree read are the slow lookups; run them in the
+    # background while the psutil snapshot below is taken
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        temp_future = executor.submit(get_cpu_temp)
+        model_future = executor.submit(get_pi_model)
+
+        # Snapshot every psutil value once, up front
+        cpu_count = psutil.cpu_count()
+        cpu_freq = get_cpu_freq()
+        # Without an interval the first call has no baseline and returns 0.0;
+        # a short explicit window is meaningful and overlaps the pool's work
+        cpu_usage = psutil.cpu_percent(interval=0.1)
+        load = psutil.getloadavg()
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        disk = psutil.disk_usage('/')
+        net_if = psutil.net_if_addrs()
+        uptime = get_uptime()
+
+        temp = temp_future.result()
+        model = model_future.result()
 
     # Header
     header_text = """
@@ -82,25 +140,22 @@ def main():
     sys_table.add_column("Property", style="cyan")
     sys_table.add_column("Value", style="green")
 
-    sys_table.add_row("Model", get_pi_model())
-    sys_table.add_row("Hostname", platform.node())
-    sys_table.add_row("Kernel", platform.release())
-    sys_table.add_row("Architecture", platform.machine())
-    sys_table.add_row("Python", platform.python_version())
-    sys_table.add_row("Uptime", get_uptime())
+    sys_table.add_row("Model", model)
+    sys_table.add_row("Hostname", UNAME.nodename)
+    sys_table.add_row("Kernel", UNAME.release)
+    sys_table.add_row("Architecture", UNAME.machine)
+    sys_table.add_row("Python", PYTHON_VERSION)
+    sys_table.add_row("Uptime", uptime)
 
     # CPU Table
     cpu_table = Table(title="CPU", box=box.ROUNDED, border_style="yellow")
     cpu_table.add_column("Property", style="yellow")
     cpu_table.add_column("Value", style="green")
 
-    cpu_freq = psutil.cpu_freq()
-    cpu_table.add_row("Cores", str(psutil.cpu_count()))
-    cpu_table.add_row("Frequency", f"{cpu_freq.current:.0f} MHz" if cpu_freq else "N/A")
-    cpu_table.add_row("Usage", f"{psutil.cpu_percent():.1f}%")
-    cpu_table.add_row("Temperature", get_cpu_temp())
-
-    load = psutil.getloadavg()
+    cpu_table.add_row("Cores", str(cpu_count))
+    cpu_table.add_row("Frequency", f"{cpu_freq:.0f} MHz" if cpu_freq else "N/A")
+    cpu_table.add_row("Usage", f"{cpu_usage:.1f}%")
+    cpu_table.add_row("Temperature", temp)
     cpu_table.add_row("Load (1/5/15m)", f"{load[0]:.2f} / {load[1]:.2f} / {load[2]:.2f}")
 
     # Memory Table
@@ -108,9 +163,6 @@ def main():
     mem_table.add_column("Property", style="magenta")
     mem_table.add_column("Value", style="green")
 
-    mem = psutil.virtual_memory()
-    swap = psutil.swap_memory()
-
     mem_table.add_row("Total RAM", format_bytes(mem.total))
     mem_table.add_row("Used RAM", f"{format_bytes(mem.used)} ({mem.percent:.1f}%)")
     mem_table.add_row("Available", format_bytes(mem.available))
@@ -121,7 +173,6 @@ def main():
     disk_table.add_column("Property", style="blue")
     disk_table.add_column("Value", style="green")
 
-    disk = psutil.disk_usage('/')
     disk_table.add_row("Total", format_bytes(disk.total))
     disk_table.add_row("Used", f"{format_bytes(disk.used)} ({disk.percent:.1f}%)")
     disk_table.add_row("Free", format_bytes(disk.free))
@@ -131,23 +182,22 @@ def main():
     net_table.add_column("Interface", style="red")
     net_table.add_column("IP Address", style="green")
 
-    for iface, addrs in psutil.net_if_addrs().items():
+    for iface, addrs in net_if.items():
         for addr in addrs:
-            if addr.family.name == 'AF_INET' and addr.address != '127.0.0.1':
+            if addr.family == socket.AF_INET and not addr.address.startswith('127.'):
                 net_table.add_row(iface, addr.address)
-
-    # Print all tables
-    console.print()
-    console.print(sys_table)
-    console.print()
-    console.print(cpu_table)
-    console.print()
-    console.print(mem_table)
-    console.print()
-    console.print(disk_table)
-    console.print()
-    console.print(net_table)
-    console.print()
+                break  # One row per interface
+
+    # Print all tables as one renderable: one layout pass and one write to
+    # the terminal instead of one per table and spacer line
+    console.print(Group(
+        "", sys_table,
+        "", cpu_table,
+        "", mem_table,
+        "", disk_table,
+        "", net_table,
+        "",
+    ))
 
     # Footer
     console.print(Panel(
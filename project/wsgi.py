@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Pi Dashboard
+Built by Claude on Raspberry Pi 5
+
+Serve the dashboard with a production server instead of Flask's:
+
+    gunicorn -w 1 --threads 8 -b 0.0.0.0:5000 wsgi:app
+
+Keep it to one worker: each worker would run its own stats sampler, and
+with one shared sampler the threads only serialize cached snapshots.
+"""
+
+from pi_dashboard import app, start_sampler
+
+start_sampler()